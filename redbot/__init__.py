@@ -179,7 +179,8 @@ class VersionInfo:
 
 
 def _update_event_loop_policy():
-    if _sys.implementation.name == "cpython":
+    # uvloop doesn't support Windows so don't even try to import it there
+    if _sys.implementation.name == "cpython" and _sys.platform != "win32":
         # Let's not force this dependency, uvloop is much faster on cpython
         try:
             import uvloop
@@ -6,34 +6,46 @@ _early_init()
 import asyncio
 import functools
 import getpass
-import json
 import logging
 import os
-import pip
-import pkg_resources
 import platform
+import re
 import shutil
 import signal
 import sys
 from argparse import Namespace
-from copy import deepcopy
 from pathlib import Path
-from typing import NoReturn
+from typing import TYPE_CHECKING, Tuple
 
-import discord
-import rich
+try:
+    # orjson is considerably faster at decoding but we don't want to force this dependency
+    import orjson as json
+except ImportError:
+    import json
 
-import redbot.logging
 from redbot import __version__
-from redbot.core.bot import Red, ExitCodes, _NoOwnerSet
 from redbot.core.cli import interactive_config, confirm, parse_cli_flags
-from redbot.setup import get_data_dir, get_name, save_config
-from redbot.core import data_manager, drivers
-from redbot.core._sharedlibdeprecation import SharedLibImportWarner
+from redbot.core import data_manager
+
+# Modules needed only for running the bot (or editing the instance) are imported
+# in the functions that use them so that early exit flags (such as --version)
+# don't pay for importing them.
+if TYPE_CHECKING:
+    from redbot.core.bot import Red
 
 
 log = logging.getLogger("red.main")
 
+MIN_TOKEN_LENGTH = 50
+MIN_OWNER_ID_LENGTH = 15
+MAX_OWNER_ID_LENGTH = 20
+_OWNER_ID_RE = re.compile(rf"\d{{{MIN_OWNER_ID_LENGTH},{MAX_OWNER_ID_LENGTH}}}")
+# --owner is already parsed to int so it's checked against the range of IDs with allowed length
+_MIN_OWNER_ID = 10 ** (MIN_OWNER_ID_LENGTH - 1)
+_MAX_OWNER_ID = 10**MAX_OWNER_ID_LENGTH - 1
+# plain str path lets us skip pathlib's indirection when accessing the file
+_CONFIG_FILE_STR = os.fspath(data_manager.config_file)
+
 #
 #               Red - Discord Bot v3
 #
@@ -41,22 +53,51 @@ log = logging.getLogger("red.main")
 #
 
 
+@functools.lru_cache(maxsize=1)
+def _load_instance_names(mtime_ns: int) -> Tuple[str, ...]:
+    # `mtime_ns` is only used as the cache key,
+    # so that the file is read again only after it got modified.
+    # Only the (top-level) instance names are kept, the rest of the data is discarded.
+    with open(_CONFIG_FILE_STR, "rb", buffering=0) as fs:
+        names = json.loads(fs.read()).keys()
+    if len(names) < 2:
+        # nothing to sort, which is the case for most users
+        return tuple(names)
+    return tuple(sorted(names))
+
+
 def _get_instance_names():
-    with data_manager.config_file.open(encoding="utf-8") as fs:
-        data = json.load(fs)
-    return sorted(data.keys())
+    return list(_load_instance_names(os.stat(_CONFIG_FILE_STR).st_mtime_ns))
+
+
+def _show_status(text: str) -> None:
+    # Status is only shown in interactive terminals as it gets erased with `_clear_status()`.
+    if sys.stdout.isatty():
+        sys.stdout.write(f"{text}\r")
+        sys.stdout.flush()
+
+
+def _clear_status(text: str) -> None:
+    if sys.stdout.isatty():
+        sys.stdout.write(f"{' ' * len(text)}\r")
 
 
 def list_instances():
-    if not data_manager.config_file.exists():
+    status = "Loading instances..."
+    _show_status(status)
+    try:
+        instance_names = _get_instance_names()
+    except FileNotFoundError:
+        _clear_status(status)
         print(
             "No instances have been configured! Configure one "
             "using `redbot-setup` before trying to run the bot!"
         )
         sys.exit(1)
     else:
+        _clear_status(status)
         text = "Configured Instances:\n\n"
-        for instance_name in _get_instance_names():
+        for instance_name in instance_names:
             text += "{}\n".format(instance_name)
         print(text)
         sys.exit(0)
@@ -64,8 +105,12 @@ def list_instances():
 
 def debug_info():
     """Shows debug information useful for debugging."""
+    status = "Collecting debug info..."
+    _show_status(status)
     if sys.platform == "linux":
         import distro  # pylint: disable=import-error
+    import discord
+    import pip
 
     IS_WINDOWS = os.name == "nt"
     IS_MAC = sys.platform == "darwin"
@@ -96,11 +141,14 @@ def debug_info():
         + "User: {}\n".format(user_who_ran)
         + "Metadata file: {}\n".format(data_manager.config_file)
     )
+    _clear_status(status)
     print(info)
     sys.exit(0)
 
 
 async def edit_instance(red, cli_flags):
+    from redbot.setup import save_config
+
     no_prompt = cli_flags.no_prompt
     token = cli_flags.token
     owner = cli_flags.owner
@@ -119,7 +167,10 @@ async def edit_instance(red, cli_flags):
         sys.exit(1)
     if (
         no_prompt
-        and all(to_change is None for to_change in (token, owner, new_name, data_path))
+        and token is None
+        and owner is None
+        and new_name is None
+        and data_path is None
         and not prefix
     ):
         print(
@@ -129,37 +180,61 @@ async def edit_instance(red, cli_flags):
         )
         sys.exit(1)
 
-    await _edit_token(red, token, no_prompt)
-    await _edit_prefix(red, prefix, no_prompt)
-    await _edit_owner(red, owner, no_prompt)
+    if not no_prompt:
+        try:
+            # importing readline is enough for input() to use it for line editing
+            import readline  # pylint: disable=unused-import
+        except ImportError:
+            # not available on Windows
+            pass
+
+    # Config updates are collected so that the prompts don't have to wait for any writes
+    # and then they're all written at once.
+    config_updates = {}
+    await _edit_token(red, token, no_prompt, config_updates)
+    await _edit_prefix(red, prefix, no_prompt, config_updates)
+    await _edit_owner(red, owner, no_prompt, config_updates)
+    await asyncio.gather(
+        *(red._config.get_attr(key).set(value) for key, value in config_updates.items())
+    )
 
-    data = deepcopy(data_manager.basic_config)
+    data = _clone_basic_config()
     name = _edit_instance_name(old_name, new_name, confirm_overwrite, no_prompt)
     _edit_data_path(data, name, data_path, copy_data, no_prompt)
 
-    save_config(name, data)
-    if old_name != name:
-        save_config(old_name, {}, remove=True)
+    save_config(name, data, old_name=old_name)
+    _load_instance_names.cache_clear()
+
 
+def _clone_basic_config():
+    # basic config is a flat JSON-compatible dict with (at most) flat containers as values
+    # so there's no need to go through deepcopy() machinery
+    return {
+        key: value.copy() if isinstance(value, (dict, list)) else value
+        for key, value in data_manager.basic_config.items()
+    }
 
-async def _edit_token(red, token, no_prompt):
+
+async def _edit_token(red, token, no_prompt, config_updates):
     if token:
-        if not len(token) >= 50:
+        if len(token) < MIN_TOKEN_LENGTH:
             print(
                 "The provided token doesn't look a valid Discord bot token."
                 " Instance's token will remain unchanged.\n"
             )
             return
-        await red._config.token.set(token)
+        config_updates["token"] = token
     elif not no_prompt and confirm("Would you like to change instance's token?", default=False):
         await interactive_config(red, False, True, print_header=False)
         print("Token updated.\n")
 
 
-async def _edit_prefix(red, prefix, no_prompt):
+async def _edit_prefix(red, prefix, no_prompt, config_updates):
     if prefix:
-        prefixes = sorted(prefix, reverse=True)
-        await red._config.prefix.set(prefixes)
+        # copy to not reorder the list stored in cli flags
+        prefixes = list(prefix)
+        prefixes.sort(reverse=True)
+        config_updates["prefix"] = prefixes
     elif not no_prompt and confirm("Would you like to change instance's prefixes?", default=False):
         print(
             "Enter the prefixes, separated by a space (please note "
@@ -170,21 +245,21 @@ async def _edit_prefix(red, prefix, no_prompt):
             if not prefixes:
                 print("You need to pass at least one prefix!")
                 continue
-            prefixes = sorted(prefixes, reverse=True)
-            await red._config.prefix.set(prefixes)
+            prefixes.sort(reverse=True)
+            config_updates["prefix"] = prefixes
             print("Prefixes updated.\n")
             break
 
 
-async def _edit_owner(red, owner, no_prompt):
+async def _edit_owner(red, owner, no_prompt, config_updates):
     if owner:
-        if not (15 <= len(str(owner)) <= 20):
+        if not (_MIN_OWNER_ID <= owner <= _MAX_OWNER_ID):
             print(
                 "The provided owner id doesn't look like a valid Discord user id."
                 " Instance's owner will remain unchanged."
             )
             return
-        await red._config.owner.set(owner)
+        config_updates["owner"] = owner
     elif not no_prompt and confirm("Would you like to change instance's owner?", default=False):
         print(
             "Remember:\n"
@@ -196,11 +271,11 @@ async def _edit_owner(red, owner, no_prompt):
             print("Please enter a Discord user id for new owner:")
             while True:
                 owner_id = input("> ").strip()
-                if not (15 <= len(owner_id) <= 20 and owner_id.isdecimal()):
+                if _OWNER_ID_RE.fullmatch(owner_id) is None:
                     print("That doesn't look like a valid Discord user id.")
                     continue
                 owner_id = int(owner_id)
-                await red._config.owner.set(owner_id)
+                config_updates["owner"] = owner_id
                 print("Owner updated.")
                 break
         else:
@@ -209,6 +284,8 @@ async def _edit_owner(red, owner, no_prompt):
 
 
 def _edit_instance_name(old_name, new_name, confirm_overwrite, no_prompt):
+    from redbot.setup import get_name
+
     if new_name:
         name = new_name
         if name in _get_instance_names() and not confirm_overwrite:
@@ -242,7 +319,10 @@ def _edit_instance_name(old_name, new_name, confirm_overwrite, no_prompt):
 
 
 def _edit_data_path(data, instance_name, data_path, copy_data, no_prompt):
+    from redbot.setup import get_data_dir
+
     # This modifies the passed dict.
+    old_data_path = data_manager.basic_config["DATA_PATH"]
     if data_path:
         new_path = Path(data_path)
         try:
@@ -263,23 +343,23 @@ def _edit_data_path(data, instance_name, data_path, copy_data, no_prompt):
                     " Data location will remain unchanged."
                 )
         data["DATA_PATH"] = data_path
-        if copy_data and not _copy_data(data):
+        if copy_data and not _copy_data(old_data_path, data):
             print("Can't copy data to non-empty location. Data location will remain unchanged.")
-            data["DATA_PATH"] = data_manager.basic_config["DATA_PATH"]
+            data["DATA_PATH"] = old_data_path
     elif not no_prompt and confirm("Would you like to change the data location?", default=False):
         data["DATA_PATH"] = get_data_dir(instance_name)
         if confirm("Do you want to copy the data from old location?", default=True):
-            if not _copy_data(data):
+            if not _copy_data(old_data_path, data):
                 print("Can't copy the data to non-empty location.")
                 if not confirm("Do you still want to use the new data location?"):
-                    data["DATA_PATH"] = data_manager.basic_config["DATA_PATH"]
+                    data["DATA_PATH"] = old_data_path
                     print("Data location will remain unchanged.")
                     return
             print("Old data has been copied over to the new location.")
         print("Data location updated.")
 
 
-def _copy_data(data):
+def _copy_data(old_data_path, data):
     if Path(data["DATA_PATH"]).exists():
         if any(os.scandir(data["DATA_PATH"])):
             return False
@@ -287,7 +367,7 @@ def _copy_data(data):
             # this is needed because copytree doesn't work when destination folder exists
             # Python 3.8 has `dirs_exist_ok` option for that
             os.rmdir(data["DATA_PATH"])
-    shutil.copytree(data_manager.basic_config["DATA_PATH"], data["DATA_PATH"])
+    shutil.copytree(old_data_path, data["DATA_PATH"])
     return True
 
 
@@ -295,6 +375,9 @@ def handle_edit(cli_flags: Namespace):
     """
     This one exists to not log all the things like it's a full run of the bot.
     """
+    from redbot.core import drivers
+    from redbot.core.bot import Red
+
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
     data_manager.load_basic_configuration(cli_flags.instance_name)
@@ -314,7 +397,7 @@ def handle_edit(cli_flags: Namespace):
         sys.exit(0)
 
 
-async def run_bot(red: Red, cli_flags: Namespace) -> None:
+async def run_bot(red: "Red", cli_flags: Namespace) -> None:
     """
     This runs the bot.
 
@@ -326,6 +409,14 @@ async def run_bot(red: Red, cli_flags: Namespace) -> None:
     interrupt running forever, then trigger our cleanup process, and does not
     need additional handling in this function.
     """
+    import discord
+    import pkg_resources
+    import rich
+
+    import redbot.logging
+    from redbot.core import drivers
+    from redbot.core.bot import _NoOwnerSet
+    from redbot.core._sharedlibdeprecation import SharedLibImportWarner
 
     driver_cls = drivers.get_driver_class()
 
@@ -437,6 +528,8 @@ def handle_early_exit_flags(cli_flags: Namespace):
 
 
 async def shutdown_handler(red, signal_type=None, exit_code=None):
+    from redbot.core.bot import ExitCodes
+
     if signal_type:
         log.info("%s received. Quitting...", signal_type)
         # Do not collapse the below line into other logic
@@ -503,6 +596,8 @@ def main():
     if cli_flags.edit:
         handle_edit(cli_flags)
         return
+    from redbot.core.bot import Red, ExitCodes
+
     try:
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
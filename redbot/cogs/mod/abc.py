@@ -1,9 +1,11 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Optional
+from typing import Dict, List, Set, Tuple, Optional
 
 import discord
 from redbot.core import Config, commands
 from redbot.core.bot import Red
+from .utils import GuildListenerSettings
 
 
 class MixinMeta(ABC):
@@ -17,6 +19,12 @@ class MixinMeta(ABC):
         self.config: Config
         self.bot: Red
         self.cache: dict
+        self._guild_cache: Dict[int, GuildListenerSettings]
+        self._guild_cache_generations: Dict[int, int]
+        self._tempban_expiry_event: asyncio.Event
+        self._tempban_heap: List[Tuple[float, int, int]]
+        self._reinvite_cache: Dict[int, Tuple[discord.Invite, float]]
+        self._kickban_dm_tasks: Set["asyncio.Task[discord.Message]"]
 
     @staticmethod
     @abstractmethod
@@ -24,3 +32,7 @@ class MixinMeta(ABC):
         ctx: commands.Context, user_voice_state: Optional[discord.VoiceState], **perms: bool
     ) -> bool:
         raise NotImplementedError()
+
+    @abstractmethod
+    def _invalidate_guild_settings(self, guild: discord.Guild) -> None:
+        raise NotImplementedError()
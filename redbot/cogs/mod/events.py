@@ -6,6 +6,7 @@ import discord
 from redbot.core import i18n, modlog, commands
 from redbot.core.utils.mod import is_mod_or_superior
 from .abc import MixinMeta
+from .utils import GuildListenerSettings
 
 _ = i18n.Translator("Mod", __file__)
 log = logging.getLogger("red.mod")
@@ -17,6 +18,29 @@ class Events(MixinMeta):
     Has a bunch of things split off to here.
     """
 
+    async def _get_guild_settings(self, guild: discord.Guild) -> GuildListenerSettings:
+        """Get the guild settings used by the listeners, reading them from config on cache miss."""
+        settings = self._guild_cache.get(guild.id)
+        if settings is None:
+            generation = self._guild_cache_generations.get(guild.id, 0)
+            guild_data = await self.config.guild(guild).all()
+            settings = GuildListenerSettings(
+                mention_spam=guild_data["mention_spam"],
+                track_nicknames=guild_data["track_nicknames"],
+            )
+            # The settings could have been changed while reading them, in which case
+            # what was read may be outdated and shouldn't be cached.
+            if self._guild_cache_generations.get(guild.id, 0) == generation:
+                self._guild_cache[guild.id] = settings
+        return settings
+
+    def _invalidate_guild_settings(self, guild: discord.Guild) -> None:
+        """Drop the cached listener settings of the guild, call after changing them."""
+        self._guild_cache.pop(guild.id, None)
+        self._guild_cache_generations[guild.id] = (
+            self._guild_cache_generations.get(guild.id, 0) + 1
+        )
+
     async def check_duplicates(self, message):
         guild = message.guild
         author = message.author
@@ -43,7 +67,7 @@ class Events(MixinMeta):
 
     async def check_mention_spam(self, message):
         guild, author = message.guild, message.author
-        mention_spam = await self.config.guild(guild).mention_spam.all()
+        mention_spam = (await self._get_guild_settings(guild)).mention_spam
 
         if mention_spam["strict"]:  # if strict is enabled
             mentions = message.raw_mentions
@@ -181,7 +205,7 @@ class Events(MixinMeta):
             if (not guild) or await self.bot.cog_disabled_in_guild(self, guild):
                 return
             track_all_names = await self.config.track_all_names()
-            track_nicknames = await self.config.guild(guild).track_nicknames()
+            track_nicknames = (await self._get_guild_settings(guild)).track_nicknames
             if (not track_all_names) or (not track_nicknames):
                 return
             async with self.config.member(before).past_nicks() as nick_list:
@@ -192,3 +216,12 @@ class Events(MixinMeta):
                 nick_list.append(before.nick)
                 while len(nick_list) > 20:
                     nick_list.pop(0)
+
+    @commands.Cog.listener()
+    async def on_invite_delete(self, invite: discord.Invite):
+        if invite.guild is None:
+            return
+        # don't keep sending a deleted invite to unbanned users
+        cached = self._reinvite_cache.get(invite.guild.id)
+        if cached is not None and cached[0].code == invite.code:
+            del self._reinvite_cache[invite.guild.id]
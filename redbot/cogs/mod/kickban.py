@@ -1,13 +1,14 @@
 import asyncio
 import contextlib
+import heapq
 import logging
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Tuple, Union
 
 import discord
 from redbot.core import commands, i18n, checks, modlog
 from redbot.core.commands import UserInputOptional, RawUserIdConverter
-from redbot.core.utils import AsyncIter
 from redbot.core.utils.chat_formatting import (
     pagify,
     humanize_number,
@@ -22,30 +23,89 @@ from .utils import is_allowed_by_hierarchy
 log = logging.getLogger("red.mod")
 _ = i18n.Translator("Mod", __file__)
 
+#: How long (in seconds) to wait before retrying tempbans that couldn't be checked or lifted.
+TEMPBAN_RETRY_INTERVAL = 60
+#: How many guilds can have their tempbans checked at once.
+TEMPBAN_GUILD_CONCURRENCY = 16
+#: How many unbans can be in-flight at once in a single guild.
+TEMPBAN_UNBAN_CONCURRENCY = 2
+#: How long (in seconds) a guild's permanent invite found for reinvites is reused for.
+REINVITE_CACHE_TTL = 600
+#: How many hackbans can be in-flight at once during a massban.
+MASSBAN_HACKBAN_CONCURRENCY = 3
+#: How long (in seconds) a kick or ban waits for the DM to the user before going ahead.
+KICKBAN_DM_TIMEOUT = 3
+
+
+def _build_kickban_dm_embed(
+    title: str, reason: Optional[str], color: discord.Colour
+) -> discord.Embed:
+    em = discord.Embed(title=bold(title), color=color)
+    em.add_field(
+        name=_("**Reason**"),
+        value=reason if reason is not None else _("No reason was given."),
+        inline=False,
+    )
+    return em
+
+
+def _handle_kickban_dm_result(task: "asyncio.Task[discord.Message]") -> None:
+    # We don't want blocked DMs preventing us from kicking or banning
+    if not task.cancelled() and (exc := task.exception()) is not None:
+        if not isinstance(exc, discord.HTTPException):
+            log.error("Failed to send kick/ban DM.", exc_info=exc)
+
 
 class KickBanMixin(MixinMeta):
     """
     Kick and ban commands and tasks go here.
     """
 
-    @staticmethod
-    async def get_invite_for_reinvite(ctx: commands.Context, max_age: int = 86400):
+    async def _send_kickban_dm(self, user: discord.abc.User, embed: discord.Embed) -> None:
+        # The DM has to be sent before the kick/ban as the user might not share
+        # a server with the bot afterwards, but a slow DM shouldn't hold up the action.
+        task = asyncio.create_task(user.send(embed=embed))
+        # The event loop only keeps a weak reference to the task,
+        # this one keeps it alive if it outlives the timeout.
+        self._kickban_dm_tasks.add(task)
+        task.add_done_callback(self._kickban_dm_tasks.discard)
+        task.add_done_callback(_handle_kickban_dm_result)
+        await asyncio.wait((task,), timeout=KICKBAN_DM_TIMEOUT)
+
+    async def get_invite_for_reinvite(self, ctx: commands.Context, max_age: int = 86400):
         """Handles the reinvite logic for getting an invite
         to send the newly unbanned user
         :returns: :class:`Invite`"""
         guild = ctx.guild
+        # Permanent invites (vanity or unlimited) are cached for a while
+        # so that we don't have to fetch all of guild's invites each time.
+        if (cached := self._reinvite_cache.get(guild.id)) is not None:
+            invite, cached_at = cached
+            # Deleting a channel deletes its invites, deleted invites
+            # are also dropped from the cache by `on_invite_delete`.
+            if (
+                time.monotonic() - cached_at < REINVITE_CACHE_TTL
+                and invite.channel is not None
+                and guild.get_channel(invite.channel.id) is not None
+            ):
+                return invite
+            del self._reinvite_cache[guild.id]
+
         my_perms: discord.Permissions = guild.me.guild_permissions
         if my_perms.manage_guild or my_perms.administrator:
             if "VANITY_URL" in guild.features:
                 # guild has a vanity url so use it as the one to send
                 try:
-                    return await guild.vanity_invite()
+                    invite = await guild.vanity_invite()
                 except discord.NotFound:
                     # If a guild has the vanity url feature,
                     # but does not have it set up,
                     # this prevents the command from failing
                     # and defaults back to another regular invite.
                     pass
+                else:
+                    self._reinvite_cache[guild.id] = (invite, time.monotonic())
+                    return invite
             invites = await guild.invites()
         else:
             invites = []
@@ -55,19 +115,22 @@ class KickBanMixin(MixinMeta):
                 # has unlimited uses, doesn't expire, and
                 # doesn't grant temporary membership
                 # (i.e. they won't be kicked on disconnect)
+                self._reinvite_cache[guild.id] = (inv, time.monotonic())
                 return inv
         else:  # No existing invite found that is valid
-            channels_and_perms = zip(
-                guild.text_channels, map(guild.me.permissions_in, guild.text_channels)
-            )
-            channel = next(
-                (channel for channel, perms in channels_and_perms if perms.create_instant_invite),
-                None,
-            )
+            if my_perms.administrator:
+                # administrator overrides channel overwrites, no need to compute the permissions
+                channel = next(iter(guild.text_channels), None)
+            else:
+                channel = discord.utils.find(
+                    lambda c: c.permissions_for(guild.me).create_instant_invite,
+                    guild.text_channels,
+                )
             if channel is None:
                 return
             try:
                 # Create invite that expires after max_age
+                # (not cached as `max_age` differs between callers)
                 return await channel.create_invite(max_age=max_age)
             except discord.HTTPException:
                 return
@@ -121,9 +184,13 @@ class KickBanMixin(MixinMeta):
         days: int = 0,
         reason: str = None,
         create_modlog_case=False,
+        embed_color: Optional[discord.Color] = None,
+        guild_data: Optional[dict] = None,
     ) -> Tuple[bool, str]:
         author = ctx.author
         guild = ctx.guild
+        if guild_data is None:
+            guild_data = await self.config.guild(guild).all()
 
         removed_temp = False
 
@@ -136,6 +203,9 @@ class KickBanMixin(MixinMeta):
                     False,
                     _("I cannot let you do that. Self-harm is bad {}").format("\N{PENSIVE FACE}"),
                 )
+            # The bot's hierarchy is checked first as it doesn't need a config read.
+            elif guild.me.top_role <= user.top_role or user == guild.owner:
+                return False, _("I cannot do that due to Discord hierarchy rules.")
             elif not await is_allowed_by_hierarchy(self.bot, self.config, guild, author, user):
                 return (
                     False,
@@ -145,30 +215,22 @@ class KickBanMixin(MixinMeta):
                         "hierarchy."
                     ),
                 )
-            elif guild.me.top_role <= user.top_role or user == guild.owner:
-                return False, _("I cannot do that due to Discord hierarchy rules.")
 
-            toggle = await self.config.guild(guild).dm_on_kickban()
-            if toggle:
-                with contextlib.suppress(discord.HTTPException):
-                    em = discord.Embed(
-                        title=bold(_("You have been banned from {guild}.").format(guild=guild)),
-                        color=await self.bot.get_embed_color(user),
-                    )
-                    em.add_field(
-                        name=_("**Reason**"),
-                        value=reason if reason is not None else _("No reason was given."),
-                        inline=False,
-                    )
-                    await user.send(embed=em)
+            if guild_data["dm_on_kickban"]:
+                if embed_color is None:
+                    embed_color = await self.bot.get_embed_color(user)
+                em = _build_kickban_dm_embed(
+                    _("You have been banned from {guild}.").format(guild=guild),
+                    reason,
+                    embed_color,
+                )
+                await self._send_kickban_dm(user, em)
 
             ban_type = "ban"
         else:
-            tempbans = await self.config.guild(guild).current_tempbans()
-
             ban_list = [ban.user.id for ban in await guild.bans()]
             if user.id in ban_list:
-                if user.id in tempbans:
+                if user.id in guild_data["current_tempbans"]:
                     async with self.config.guild(guild).current_tempbans() as tempbans:
                         tempbans.remove(user.id)
                     removed_temp = True
@@ -229,47 +291,160 @@ class KickBanMixin(MixinMeta):
         return True, success_message
 
     async def tempban_expirations_task(self) -> None:
+        # Guilds aren't cached before the bot is ready, tempbans couldn't be lifted until then.
+        await self.bot.wait_until_red_ready()
         while True:
             try:
-                await self._check_tempban_expirations()
+                await self._load_tempban_expirations()
             except Exception:
-                log.exception("Something went wrong in check_tempban_expirations:")
+                log.exception("Something went wrong in load_tempban_expirations:")
+                await asyncio.sleep(TEMPBAN_RETRY_INTERVAL)
+            else:
+                break
 
-            await asyncio.sleep(60)
+        while True:
+            # This is cleared *before* checking so that tempbans added during the check
+            # wake this task up again instead of getting lost.
+            self._tempban_expiry_event.clear()
+            now = time.time()
+            due: Dict[int, List[int]] = {}
+            while self._tempban_heap and self._tempban_heap[0][0] <= now:
+                _unban_timestamp, guild_id, uid = heapq.heappop(self._tempban_heap)
+                due.setdefault(guild_id, []).append(uid)
+            if due:
+                try:
+                    await self._check_tempban_expirations(due)
+                except Exception:
+                    log.exception("Something went wrong in check_tempban_expirations:")
+                    # The due tempbans were already taken off the heap, don't lose them.
+                    retry_at = time.time() + TEMPBAN_RETRY_INTERVAL
+                    for guild_id, uids in due.items():
+                        for uid in uids:
+                            heapq.heappush(self._tempban_heap, (retry_at, guild_id, uid))
+
+            if not self._tempban_heap:
+                # no tempbans, sleep until `tempban` command sets the event
+                timeout = None
+            else:
+                timeout = max(0, self._tempban_heap[0][0] - time.time())
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._tempban_expiry_event.wait(), timeout=timeout)
+
+    async def _load_tempban_expirations(self) -> None:
+        """Load every stored tempban into the heap.
+
+        This is only done once, `tempban` command schedules new tempbans afterwards.
+        """
+        loaded = []
+        for guild_id, guild_data in (await self.config.all_guilds()).items():
+            if not (guild_tempbans := guild_data["current_tempbans"]):
+                continue
+            # Only members of guilds with tempbans are read rather than every member.
+            members_data = await self.config.all_members(discord.Object(id=guild_id))
+            for uid in guild_tempbans:
+                unban_timestamp = members_data.get(uid, {}).get("banned_until", False)
+                loaded.append((unban_timestamp or 0, guild_id, uid))
+        self._tempban_heap.extend(loaded)
+        heapq.heapify(self._tempban_heap)
+
+    def _schedule_tempban_expiry(self, unban_timestamp: float, guild_id: int, uid: int) -> None:
+        """Schedule a tempban to be lifted at the given time.
+
+        The tempban expirations task is woken up if this is now the earliest expiry.
+        """
+        heapq.heappush(self._tempban_heap, (unban_timestamp, guild_id, uid))
+        if self._tempban_heap[0][0] == unban_timestamp:
+            self._tempban_expiry_event.set()
 
-    async def _check_tempban_expirations(self) -> None:
-        guilds_data = await self.config.all_guilds()
-        async for guild_id, guild_data in AsyncIter(guilds_data.items(), steps=100):
+    async def _check_tempban_expirations(self, due: Dict[int, List[int]]) -> None:
+        """Unban users whose tempbans are due.
+
+        Tempbans that couldn't be checked or lifted are scheduled to be retried later.
+
+        Parameters
+        ----------
+        due : Dict[int, List[int]]
+            Mapping of guild IDs to the IDs of users whose tempbans are due.
+        """
+        # limits how many guilds are checked at once to not burst through REST rate limits
+        semaphore = asyncio.Semaphore(TEMPBAN_GUILD_CONCURRENCY)
+
+        async def check_guild(guild_id: int, uids: List[int]) -> List[int]:
             if not (guild := self.bot.get_guild(guild_id)):
-                continue
-            if guild.unavailable or not guild.me.guild_permissions.ban_members:
-                continue
-            if await self.bot.cog_disabled_in_guild(self, guild):
-                continue
+                # The guild isn't cached (yet), don't drop its tempbans.
+                return uids
+            if (
+                guild.unavailable
+                or not guild.me.guild_permissions.ban_members
+                or await self.bot.cog_disabled_in_guild(self, guild)
+            ):
+                # we can't lift the tempbans in this guild, try again later
+                return uids
+            # The context manager holds the value's lock and re-reads the tempbans,
+            # so tempbans added concurrently don't get overwritten on write back.
+            async with semaphore, self.config.guild(guild).current_tempbans() as guild_tempbans:
+                return await self._check_guild_tempban_expirations(guild, guild_tempbans, uids)
+
+        guild_ids = list(due)
+        results = await asyncio.gather(
+            *(check_guild(guild_id, due[guild_id]) for guild_id in guild_ids),
+            return_exceptions=True,
+        )
 
-            guild_tempbans = guild_data["current_tempbans"]
-            if not guild_tempbans:
-                continue
-            async with self.config.guild(guild).current_tempbans.get_lock():
-                if await self._check_guild_tempban_expirations(guild, guild_tempbans):
-                    await self.config.guild(guild).current_tempbans.set(guild_tempbans)
+        retry_at = time.time() + TEMPBAN_RETRY_INTERVAL
+        for guild_id, result in zip(guild_ids, results):
+            # `BaseException` as the check could also have been cancelled
+            if isinstance(result, BaseException):
+                log.error("Failed to check tempban expirations in a guild.", exc_info=result)
+                # make sure that the failed guild gets retried
+                result = due[guild_id]
+            for uid in result:
+                heapq.heappush(self._tempban_heap, (retry_at, guild_id, uid))
 
     async def _check_guild_tempban_expirations(
-        self, guild: discord.Guild, guild_tempbans: List[int]
-    ) -> bool:
-        changed = False
-        for uid in guild_tempbans.copy():
-            unban_time = datetime.fromtimestamp(
-                await self.config.member_from_ids(guild.id, uid).banned_until(),
-                timezone.utc,
-            )
-            if datetime.now(timezone.utc) > unban_time:
+        self, guild: discord.Guild, guild_tempbans: List[int], uids: List[int]
+    ) -> List[int]:
+        """Lift the given users' tempbans if they expired, removing them from the passed list.
+
+        Returns
+        -------
+        List[int]
+            The IDs of users whose tempbans should be retried later.
+        """
+        expired = []
+        # one read for the whole guild rather than one per tempbanned user
+        members_data = await self.config.all_members(guild)
+        now = time.time()
+        for uid in uids:
+            if uid not in guild_tempbans:
+                # the tempban was lifted in the meantime
+                continue
+            # `banned_until` is a POSIX timestamp, `False` when unset
+            unban_timestamp = members_data.get(uid, {}).get("banned_until", False)
+            # A later `banned_until` means the user has been tempbanned again since
+            # and that tempban has its own entry in the heap.
+            if now >= unban_timestamp:
+                expired.append(uid)
+        if not expired:
+            return []
+
+        # Discord's rate limits for the unban route are strict so only a couple of
+        # unbans are in-flight at once.
+        semaphore = asyncio.Semaphore(TEMPBAN_UNBAN_CONCURRENCY)
+        missing_permissions = False
+
+        async def try_unban(uid: int) -> bool:
+            """Returns whether the user is no longer banned."""
+            nonlocal missing_permissions
+            async with semaphore:
+                if missing_permissions:
+                    # skip the rest of this guild
+                    return False
                 try:
                     await guild.unban(discord.Object(id=uid), reason=_("Tempban finished"))
                 except discord.NotFound:
                     # user is not banned anymore
-                    guild_tempbans.remove(uid)
-                    changed = True
+                    return True
                 except discord.HTTPException as e:
                     # 50013: Missing permissions error code or 403: Forbidden status
                     if e.code == 50013 or e.status == 403:
@@ -277,13 +452,26 @@ class KickBanMixin(MixinMeta):
                             f"Failed to unban ({uid}) user from "
                             f"{guild.name}({guild.id}) guild due to permissions."
                         )
-                        break  # skip the rest of this guild
-                    log.info(f"Failed to unban member: error code: {e.code}")
+                        missing_permissions = True
+                    else:
+                        log.info(f"Failed to unban member: error code: {e.code}")
+                    return False
                 else:
                     # user unbanned successfully
-                    guild_tempbans.remove(uid)
-                    changed = True
-        return changed
+                    return True
+
+        results = await asyncio.gather(*(try_unban(uid) for uid in expired))
+        lifted = set()
+        failed = []
+        for uid, unbanned in zip(expired, results):
+            if unbanned:
+                lifted.add(uid)
+            else:
+                # try again later
+                failed.append(uid)
+        # Rewritten in place so that the context manager writes the change back.
+        guild_tempbans[:] = [uid for uid in guild_tempbans if uid not in lifted]
+        return failed
 
     @commands.command()
     @commands.guild_only()
@@ -312,6 +500,10 @@ class KickBanMixin(MixinMeta):
                 )
             )
             return
+        # The bot's hierarchy is checked first as it doesn't need a config read.
+        elif ctx.guild.me.top_role <= member.top_role or member == ctx.guild.owner:
+            await ctx.send(_("I cannot do that due to Discord hierarchy rules."))
+            return
         elif not await is_allowed_by_hierarchy(self.bot, self.config, guild, author, member):
             await ctx.send(
                 _(
@@ -321,23 +513,15 @@ class KickBanMixin(MixinMeta):
                 )
             )
             return
-        elif ctx.guild.me.top_role <= member.top_role or member == ctx.guild.owner:
-            await ctx.send(_("I cannot do that due to Discord hierarchy rules."))
-            return
         audit_reason = get_audit_reason(author, reason, shorten=True)
         toggle = await self.config.guild(guild).dm_on_kickban()
         if toggle:
-            with contextlib.suppress(discord.HTTPException):
-                em = discord.Embed(
-                    title=bold(_("You have been kicked from {guild}.").format(guild=guild)),
-                    color=await self.bot.get_embed_color(member),
-                )
-                em.add_field(
-                    name=_("**Reason**"),
-                    value=reason if reason is not None else _("No reason was given."),
-                    inline=False,
-                )
-                await member.send(embed=em)
+            em = _build_kickban_dm_embed(
+                _("You have been kicked from {guild}.").format(guild=guild),
+                reason,
+                await self.bot.get_embed_color(member),
+            )
+            await self._send_kickban_dm(member, em)
         try:
             await guild.kick(member, reason=audit_reason)
             log.info("{}({}) kicked {}({})".format(author.name, author.id, member.name, member.id))
@@ -390,13 +574,19 @@ class KickBanMixin(MixinMeta):
         Minimum 0 days, maximum 7. If not specified, the defaultdays setting will be used instead.
         """
         guild = ctx.guild
+        guild_data = await self.config.guild(guild).all()
         if days is None:
-            days = await self.config.guild(guild).default_days()
+            days = guild_data["default_days"]
         if isinstance(user, int):
             user = self.bot.get_user(user) or discord.Object(id=user)
 
         success_, message = await self.ban_user(
-            user=user, ctx=ctx, days=days, reason=reason, create_modlog_case=True
+            user=user,
+            ctx=ctx,
+            days=days,
+            reason=reason,
+            create_modlog_case=True,
+            guild_data=guild_data,
         )
 
         await ctx.send(message)
@@ -425,6 +615,8 @@ class KickBanMixin(MixinMeta):
         using this command.
         """
         banned = []
+        # mirrors `banned` for membership checks
+        banned_set = set()
         errors = {}
         upgrades = []
 
@@ -445,9 +637,9 @@ class KickBanMixin(MixinMeta):
                 await ctx.send(p)
 
         def remove_processed(ids):
-            return [_id for _id in ids if _id not in banned and _id not in errors]
+            return [_id for _id in ids if _id not in banned_set and _id not in errors]
 
-        user_ids = list(set(user_ids))  # No dupes
+        user_ids = list(dict.fromkeys(user_ids))  # No dupes, keeps the order
 
         author = ctx.author
         guild = ctx.guild
@@ -456,8 +648,9 @@ class KickBanMixin(MixinMeta):
             await ctx.send_help()
             return
 
+        guild_data = await self.config.guild(guild).all()
         if days is None:
-            days = await self.config.guild(guild).default_days()
+            days = guild_data["default_days"]
 
         if not (0 <= days <= 7):
             await ctx.send(_("Invalid days. Must be between 0 and 7."))
@@ -466,19 +659,20 @@ class KickBanMixin(MixinMeta):
         if not guild.me.guild_permissions.ban_members:
             return await ctx.send(_("I lack the permissions to do this."))
 
-        tempbans = await self.config.guild(guild).current_tempbans()
+        tempbans = set(guild_data["current_tempbans"])
 
         ban_list = await guild.bans()
+        user_ids_to_check = set(user_ids)
         for entry in ban_list:
-            for user_id in user_ids:
-                if entry.user.id == user_id:
-                    if user_id in tempbans:
-                        # We need to check if a user is tempbanned here because otherwise they won't be processed later on.
-                        continue
-                    else:
-                        errors[user_id] = _("User with ID {user_id} is already banned.").format(
-                            user_id=user_id
-                        )
+            user_id = entry.user.id
+            if user_id in user_ids_to_check:
+                if user_id in tempbans:
+                    # We need to check if a user is tempbanned here because otherwise they won't be processed later on.
+                    continue
+                else:
+                    errors[user_id] = _("User with ID {user_id} is already banned.").format(
+                        user_id=user_id
+                    )
 
         user_ids = remove_processed(user_ids)
 
@@ -500,20 +694,35 @@ class KickBanMixin(MixinMeta):
 
         # If guild isn't chunked, we might possibly be missing the member from cache,
         # so we need to make sure that isn't the case by querying the user IDs for such guilds.
-        while to_query:
-            queried_members = await guild.query_members(user_ids=to_query[:100], limit=100)
-            members.update((member.id, member) for member in queried_members)
-            to_query = to_query[100:]
+        # Gateway allows querying up to 100 user IDs at once, the chunks are queried concurrently.
+        queried_chunks = await asyncio.gather(
+            *(
+                guild.query_members(user_ids=to_query[idx : idx + 100], limit=100)
+                for idx in range(0, len(to_query), 100)
+            )
+        )
+        members.update(
+            (member.id, member) for queried_members in queried_chunks for member in queried_members
+        )
 
         # Call `ban_user()` method for all users that turned out to be guild members.
+        # The DM embed color is the same for all members so it's only looked up once.
+        embed_color = await self.bot.get_embed_color(guild.me) if members else None
         for user_id, member in members.items():
             try:
                 # using `reason` here would shadow the reason passed to command
                 success, failure_reason = await self.ban_user(
-                    user=member, ctx=ctx, days=days, reason=reason, create_modlog_case=True
+                    user=member,
+                    ctx=ctx,
+                    days=days,
+                    reason=reason,
+                    create_modlog_case=True,
+                    embed_color=embed_color,
+                    guild_data=guild_data,
                 )
                 if success:
                     banned.append(user_id)
+                    banned_set.add(user_id)
                 else:
                     errors[user_id] = _("Failed to ban user {user_id}: {reason}").format(
                         user_id=user_id, reason=failure_reason
@@ -529,11 +738,11 @@ class KickBanMixin(MixinMeta):
             await show_results()
             return
 
-        for user_id in user_ids:
-            user = discord.Object(id=user_id)
-            audit_reason = get_audit_reason(author, reason, shorten=True)
-            async with self.config.guild(guild).current_tempbans() as tempbans:
-                if user_id in tempbans:
+        # Tempbanned users are already banned, their tempban just needs to be made permanent.
+        async with self.config.guild(guild).current_tempbans() as tempbans:
+            tempbanned = set(tempbans)
+            for user_id in user_ids:
+                if user_id in tempbanned:
                     tempbans.remove(user_id)
                     upgrades.append(str(user_id))
                     log.info(
@@ -542,34 +751,58 @@ class KickBanMixin(MixinMeta):
                         )
                     )
                     banned.append(user_id)
-                else:
-                    try:
-                        await guild.ban(user, reason=audit_reason, delete_message_days=days)
-                        log.info("{}({}) hackbanned {}".format(author.name, author.id, user_id))
-                    except discord.NotFound:
-                        errors[user_id] = _("User with ID {user_id} not found").format(
-                            user_id=user_id
-                        )
-                        continue
-                    except discord.Forbidden:
-                        errors[user_id] = _(
-                            "Could not ban user with ID {user_id}: missing permissions."
-                        ).format(user_id=user_id)
-                        continue
-                    else:
-                        banned.append(user_id)
+                    banned_set.add(user_id)
 
-            await modlog.create_case(
-                self.bot,
-                guild,
-                ctx.message.created_at.replace(tzinfo=timezone.utc),
-                "hackban",
-                user_id,
-                author,
-                reason,
-                until=None,
-                channel=None,
+        audit_reason = get_audit_reason(author, reason, shorten=True)
+        semaphore = asyncio.Semaphore(MASSBAN_HACKBAN_CONCURRENCY)
+
+        async def hackban(user_id: int) -> Optional[str]:
+            async with semaphore:
+                try:
+                    await guild.ban(
+                        discord.Object(id=user_id), reason=audit_reason, delete_message_days=days
+                    )
+                except discord.NotFound:
+                    return _("User with ID {user_id} not found").format(user_id=user_id)
+                except discord.Forbidden:
+                    return _("Could not ban user with ID {user_id}: missing permissions.").format(
+                        user_id=user_id
+                    )
+                except discord.HTTPException as e:
+                    # Errors are returned rather than raised so that a single failure
+                    # doesn't prevent the cases for the other users from being created.
+                    return _("Failed to ban user {user_id}: {reason}").format(
+                        user_id=user_id, reason=e
+                    )
+            log.info("{}({}) hackbanned {}".format(author.name, author.id, user_id))
+            return None
+
+        to_hackban = remove_processed(user_ids)
+        results = await asyncio.gather(*(hackban(user_id) for user_id in to_hackban))
+        for user_id, error in zip(to_hackban, results):
+            if error is None:
+                banned.append(user_id)
+                banned_set.add(user_id)
+            else:
+                errors[user_id] = error
+
+        await asyncio.gather(
+            *(
+                modlog.create_case(
+                    self.bot,
+                    guild,
+                    ctx.message.created_at.replace(tzinfo=timezone.utc),
+                    "hackban",
+                    user_id,
+                    author,
+                    reason,
+                    until=None,
+                    channel=None,
+                )
+                for user_id in user_ids
+                if user_id not in errors
             )
+        )
         await show_results()
 
     @commands.command()
@@ -606,6 +839,10 @@ class KickBanMixin(MixinMeta):
                 _("I cannot let you do that. Self-harm is bad {}").format("\N{PENSIVE FACE}")
             )
             return
+        # The bot's hierarchy is checked first as it doesn't need a config read.
+        elif guild.me.top_role <= member.top_role or member == guild.owner:
+            await ctx.send(_("I cannot do that due to Discord hierarchy rules."))
+            return
         elif not await is_allowed_by_hierarchy(self.bot, self.config, guild, author, member):
             await ctx.send(
                 _(
@@ -615,9 +852,6 @@ class KickBanMixin(MixinMeta):
                 )
             )
             return
-        elif guild.me.top_role <= member.top_role or member == guild.owner:
-            await ctx.send(_("I cannot do that due to Discord hierarchy rules."))
-            return
 
         guild_data = await self.config.guild(guild).all()
 
@@ -638,6 +872,7 @@ class KickBanMixin(MixinMeta):
         await self.config.member(member).banned_until.set(unban_time.timestamp())
         async with self.config.guild(guild).current_tempbans() as current_tempbans:
             current_tempbans.append(member.id)
+        self._schedule_tempban_expiry(unban_time.timestamp(), guild.id, member.id)
 
         with contextlib.suppress(discord.HTTPException):
             # We don't want blocked DMs preventing us from banning
@@ -818,18 +1053,12 @@ class KickBanMixin(MixinMeta):
             is False
         ):
             return
-        needs_unmute = True if user_voice_state.mute else False
-        needs_undeafen = True if user_voice_state.deaf else False
-        audit_reason = get_audit_reason(ctx.author, reason, shorten=True)
-        if needs_unmute and needs_undeafen:
-            await member.edit(mute=False, deafen=False, reason=audit_reason)
-        elif needs_unmute:
-            await member.edit(mute=False, reason=audit_reason)
-        elif needs_undeafen:
-            await member.edit(deafen=False, reason=audit_reason)
-        else:
+        if not (user_voice_state.mute or user_voice_state.deaf):
             await ctx.send(_("That user isn't muted or deafened by the server."))
             return
+        audit_reason = get_audit_reason(ctx.author, reason, shorten=True)
+        # Setting a state the member is already in is a no-op, so a single edit covers all cases.
+        await member.edit(mute=False, deafen=False, reason=audit_reason)
 
         guild = ctx.guild
         author = ctx.author
@@ -859,20 +1088,14 @@ class KickBanMixin(MixinMeta):
             is False
         ):
             return
-        needs_mute = True if user_voice_state.mute is False else False
-        needs_deafen = True if user_voice_state.deaf is False else False
+        if user_voice_state.mute and user_voice_state.deaf:
+            await ctx.send(_("That user is already muted and deafened server-wide."))
+            return
         audit_reason = get_audit_reason(ctx.author, reason, shorten=True)
         author = ctx.author
         guild = ctx.guild
-        if needs_mute and needs_deafen:
-            await member.edit(mute=True, deafen=True, reason=audit_reason)
-        elif needs_mute:
-            await member.edit(mute=True, reason=audit_reason)
-        elif needs_deafen:
-            await member.edit(deafen=True, reason=audit_reason)
-        else:
-            await ctx.send(_("That user is already muted and deafened server-wide."))
-            return
+        # Setting a state the member is already in is a no-op, so a single edit covers all cases.
+        await member.edit(mute=True, deafen=True, reason=audit_reason)
 
         await modlog.create_case(
             self.bot,
@@ -903,18 +1126,17 @@ class KickBanMixin(MixinMeta):
         guild = ctx.guild
         author = ctx.author
         audit_reason = get_audit_reason(ctx.author, reason, shorten=True)
-        bans = await guild.bans()
-        bans = [be.user for be in bans]
-        user = discord.utils.get(bans, id=user_id)
-        if not user:
+        # Unbanning directly saves fetching the whole ban list just to check if the user is banned.
+        try:
+            await guild.unban(discord.Object(id=user_id), reason=audit_reason)
+        except discord.NotFound:
             await ctx.send(_("It seems that user isn't banned!"))
             return
-        try:
-            await guild.unban(user, reason=audit_reason)
         except discord.HTTPException:
             await ctx.send(_("Something went wrong while attempting to unban that user."))
             return
         else:
+            user = ctx.bot.get_user(user_id) or discord.Object(id=user_id)
             await modlog.create_case(
                 self.bot,
                 guild,
@@ -3,7 +3,7 @@ import logging
 import re
 from abc import ABC
 from collections import defaultdict
-from typing import List, Tuple, Literal
+from typing import Dict, List, Literal, Set, Tuple
 
 import discord
 from redbot.core.utils import AsyncIter
@@ -18,6 +18,7 @@ from .kickban import KickBanMixin
 from .names import ModInfo
 from .slowmode import Slowmode
 from .settings import ModSettings
+from .utils import GuildListenerSettings
 
 _ = T_ = Translator("Mod", __file__)
 
@@ -81,6 +82,13 @@ class Mod(
         self.config.register_member(**self.default_member_settings)
         self.config.register_user(**self.default_user_settings)
         self.cache: dict = {}
+        self._guild_cache: Dict[int, GuildListenerSettings] = {}
+        # bumped whenever a guild's cached settings are invalidated
+        self._guild_cache_generations: Dict[int, int] = {}
+        self._tempban_expiry_event = asyncio.Event()
+        self._tempban_heap: List[Tuple[float, int, int]] = []
+        self._reinvite_cache: Dict[int, Tuple[discord.Invite, float]] = {}
+        self._kickban_dm_tasks: Set["asyncio.Task[discord.Message]"] = set()
         self.tban_expiry_task = asyncio.create_task(self.tempban_expirations_task())
         self.last_case: dict = defaultdict(dict)
 
@@ -97,22 +105,33 @@ class Mod(
 
         all_members = await self.config.all_members()
 
-        async for guild_id, guild_data in AsyncIter(all_members.items(), steps=100):
-            if user_id in guild_data:
-                await self.config.member_from_ids(guild_id, user_id).clear()
+        member_guild_ids = [
+            guild_id for guild_id, guild_data in all_members.items() if user_id in guild_data
+        ]
 
-        await self.config.user_from_id(user_id).clear()
+        await asyncio.gather(
+            *(
+                self.config.member_from_ids(guild_id, user_id).clear()
+                for guild_id in member_guild_ids
+            ),
+            self.config.user_from_id(user_id).clear(),
+        )
 
-        guild_data = await self.config.all_guilds()
+        all_guilds = await self.config.all_guilds()
+
+        tempban_guild_ids = [
+            guild_id
+            for guild_id, guild_data in all_guilds.items()
+            if user_id in guild_data["current_tempbans"]
+        ]
+
+        async def remove_tempban(guild_id: int) -> None:
+            # The context manager re-reads the tempbans under the value's lock,
+            # they could have changed since getting all guilds.
+            async with self.config.guild_from_id(guild_id).current_tempbans() as tbs:
+                tbs[:] = [uid for uid in tbs if uid != user_id]
 
-        async for guild_id, guild_data in AsyncIter(guild_data.items(), steps=100):
-            if user_id in guild_data["current_tempbans"]:
-                async with self.config.guild_from_id(guild_id).current_tempbans() as tbs:
-                    try:
-                        tbs.remove(user_id)
-                    except ValueError:
-                        pass
-                    # possible with a context switch between here and getting all guilds
+        await asyncio.gather(*(remove_tempban(guild_id) for guild_id in tempban_guild_ids))
 
     async def initialize(self):
         await self._maybe_update_config()
@@ -176,6 +195,9 @@ class Mod(
                         if "mention_spam" not in guild_data:
                             guild_data["mention_spam"] = {}
                         guild_data["mention_spam"]["ban"] = current_state
+                if current_state is not False:
+                    # listeners may have already cached the settings from before the update
+                    self._invalidate_guild_settings(discord.Object(id=guild_id))
             await self.config.version.set("1.3.0")
 
     @commands.command()
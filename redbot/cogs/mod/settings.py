@@ -160,6 +160,7 @@ class ModSettings(MixinMeta):
         else:
             msg = _("Mention spam will only account for mentions of different users.")
         await self.config.guild(guild).mention_spam.strict.set(enabled)
+        self._invalidate_guild_settings(guild)
         await ctx.send(msg)
 
     @mentionspam.command(name="warn")
@@ -178,6 +179,7 @@ class ModSettings(MixinMeta):
             if not mention_spam["warn"]:
                 return await ctx.send(_("Autowarn for mention spam is already disabled."))
             await self.config.guild(ctx.guild).mention_spam.warn.set(False)
+            self._invalidate_guild_settings(ctx.guild)
             return await ctx.send(_("Autowarn for mention spam disabled."))
 
         if max_mentions < 1:
@@ -194,6 +196,7 @@ class ModSettings(MixinMeta):
                 mismatch_message += _("\nAutowarn is equal to or higher than autoban.")
 
         await self.config.guild(ctx.guild).mention_spam.warn.set(max_mentions)
+        self._invalidate_guild_settings(ctx.guild)
         await ctx.send(
             _(
                 "Autowarn for mention spam enabled. "
@@ -218,6 +221,7 @@ class ModSettings(MixinMeta):
             if not mention_spam["kick"]:
                 return await ctx.send(_("Autokick for mention spam is already disabled."))
             await self.config.guild(ctx.guild).mention_spam.kick.set(False)
+            self._invalidate_guild_settings(ctx.guild)
             return await ctx.send(_("Autokick for mention spam disabled."))
 
         if max_mentions < 1:
@@ -234,6 +238,7 @@ class ModSettings(MixinMeta):
                 mismatch_message += _("\nAutokick is equal to or higher than autoban.")
 
         await self.config.guild(ctx.guild).mention_spam.kick.set(max_mentions)
+        self._invalidate_guild_settings(ctx.guild)
         await ctx.send(
             _(
                 "Autokick for mention spam enabled. "
@@ -257,6 +262,7 @@ class ModSettings(MixinMeta):
             if not mention_spam["ban"]:
                 return await ctx.send(_("Autoban for mention spam is already disabled."))
             await self.config.guild(ctx.guild).mention_spam.ban.set(False)
+            self._invalidate_guild_settings(ctx.guild)
             return await ctx.send(_("Autoban for mention spam disabled."))
 
         if max_mentions < 1:
@@ -273,6 +279,7 @@ class ModSettings(MixinMeta):
                 mismatch_message += _("\nAutoban is equal to or lower than autokick.")
 
         await self.config.guild(ctx.guild).mention_spam.ban.set(max_mentions)
+        self._invalidate_guild_settings(ctx.guild)
         await ctx.send(
             _(
                 "Autoban for mention spam enabled. "
@@ -438,6 +445,7 @@ class ModSettings(MixinMeta):
         else:
             msg = _("Nickname changes will no longer be tracked.")
         await self.config.guild(guild).track_nicknames.set(enabled)
+        self._invalidate_guild_settings(guild)
         await ctx.send(msg)
 
     @modset.command()
@@ -11,3 +11,13 @@ async def is_allowed_by_hierarchy(
         return True
     is_special = mod == guild.owner or await bot.is_owner(mod)
     return mod.top_role > user.top_role or is_special
+
+
+class GuildListenerSettings:
+    """The guild settings used by Mod's listeners, see ``Events._get_guild_settings()``."""
+
+    __slots__ = ("mention_spam", "track_nicknames")
+
+    def __init__(self, *, mention_spam: dict, track_nicknames: bool):
+        self.mention_spam = mention_spam
+        self.track_nicknames = track_nicknames
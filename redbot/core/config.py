@@ -1,5 +1,6 @@
 import asyncio
 import collections.abc
+import itertools
 import json
 import logging
 import pickle
@@ -27,6 +28,8 @@ log = logging.getLogger("red.config")
 
 _T = TypeVar("_T")
 
+# Config instances stay cached only for as long as something (usually the cog) references them,
+# a cog that's unloaded and garbage collected gets a fresh instance when it's loaded again.
 _config_cache = weakref.WeakValueDictionary()
 _retrieved = weakref.WeakSet()
 
@@ -48,8 +51,10 @@ class ConfigMeta(type):
             raise ValueError("You must provide either the cog instance or a cog name.")
 
         key = (cog_name, unique_identifier)
-        if key in _config_cache:
-            return _config_cache[key]
+        # a single lookup, the instance could get collected between `in` and `[]`
+        instance = _config_cache.get(key)
+        if instance is not None:
+            return instance
 
         instance = super(ConfigMeta, cls).__call__(
             cog_name, unique_identifier, driver, force_registration, defaults
@@ -103,7 +108,9 @@ class _ValueCtxManager(Awaitable[_T], AsyncContextManager[_T]):  # pylint: disab
                 "list or dict) in order to use a config value as "
                 "a context manager."
             )
-        self.__original_value = pickle.loads(pickle.dumps(self.raw_value, -1))
+        # A serialized snapshot is enough to tell if the value was modified
+        # and is cheaper than keeping a deep copy of it around.
+        self.__original_value = self._serialize(self.raw_value)
         return self.raw_value
 
     async def __aexit__(self, exc_type, exc, tb):
@@ -112,12 +119,23 @@ class _ValueCtxManager(Awaitable[_T], AsyncContextManager[_T]):  # pylint: disab
                 raw_value = _str_key_dict(self.raw_value)
             else:
                 raw_value = self.raw_value
-            if raw_value != self.__original_value:
+            if (
+                self.__original_value is None
+                or self._serialize(raw_value) != self.__original_value
+            ):
                 await self.value_obj.set(self.raw_value)
         finally:
             if self.__acquire_lock is True:
                 self.__lock.release()
 
+    @staticmethod
+    def _serialize(value: Any) -> Optional[str]:
+        try:
+            return json.dumps(value, sort_keys=True)
+        except (TypeError, ValueError):
+            # can't be compared this way, treat it as modified
+            return None
+
 
 class Value:
     """A singular "value" of data.
@@ -170,13 +188,14 @@ class Value:
             A lock which is weakly cached for this value object.
 
         """
-        return self._config._lock_cache.setdefault(self.identifier_data, asyncio.Lock())
+        return self._config._get_lock(self.identifier_data)
 
     async def _get(self, default=...):
         try:
             ret = await self.driver.get(self.identifier_data)
         except KeyError:
-            return default if default is not ... else self.default
+            # the registered default is shared, so callers get a copy they can mutate
+            return default if default is not ... else _clone_defaults(self.default)
         return ret
 
     def __call__(self, default=..., *, acquire_lock: bool = True) -> _ValueCtxManager[Any]:
@@ -290,6 +309,8 @@ class Group(Value):
         config: "Config",
         force_registration: bool = False,
     ):
+        # registered children, built on first attribute access
+        self._attr_cache: Dict[str, Union[Group, Value]] = {}
         self._defaults = defaults
         self.force_registration = force_registration
         self.driver = driver
@@ -298,11 +319,19 @@ class Group(Value):
 
     @property
     def defaults(self):
-        return pickle.loads(pickle.dumps(self._defaults, -1))
+        return _clone_defaults(self._defaults)
 
     async def _get(self, default: Dict[str, Any] = ...) -> Dict[str, Any]:
-        default = default if default is not ... else self.defaults
-        raw = await super()._get(default)
+        if default is ...:
+            try:
+                raw = await self.driver.get(self.identifier_data)
+            except KeyError:
+                # Nothing is stored, a fresh copy of the defaults is the whole value
+                # and doesn't need to be copied again by `nested_update()`.
+                return self.defaults
+            default = self.defaults
+        else:
+            raw = await super()._get(default)
         if isinstance(raw, dict):
             return self.nested_update(raw, default)
         else:
@@ -333,33 +362,42 @@ class Group(Value):
             is set to :code:`True`.
 
         """
-        is_group = self.is_group(item)
-        is_value = not is_group and self.is_value(item)
-        new_identifiers = self.identifier_data.get_child(item)
-        if is_group:
-            return Group(
-                identifier_data=new_identifiers,
-                defaults=self._defaults[item],
+        try:
+            return self._attr_cache[item]
+        except KeyError:
+            pass
+        try:
+            default = self._defaults[item]
+        except KeyError:
+            if self.force_registration:
+                raise AttributeError(
+                    "'{}' is not a valid registered Group or value.".format(item)
+                ) from None
+            return Value(
+                identifier_data=self.identifier_data.get_child(item),
+                default_value=None,
                 driver=self.driver,
-                force_registration=self.force_registration,
                 config=self._config,
             )
-        elif is_value:
-            return Value(
+
+        new_identifiers = self.identifier_data.get_child(item)
+        if isinstance(default, dict):
+            attr = Group(
                 identifier_data=new_identifiers,
-                default_value=self._defaults[item],
+                defaults=default,
                 driver=self.driver,
+                force_registration=self.force_registration,
                 config=self._config,
             )
-        elif self.force_registration:
-            raise AttributeError("'{}' is not a valid registered Group or value.".format(item))
         else:
-            return Value(
+            attr = Value(
                 identifier_data=new_identifiers,
-                default_value=None,
+                default_value=default,
                 driver=self.driver,
                 config=self._config,
             )
+        self._attr_cache[item] = attr
+        return attr
 
     async def clear_raw(self, *nested_path: Any):
         """
@@ -491,14 +529,15 @@ class Group(Value):
         path = tuple(str(p) for p in nested_path)
 
         if default is ...:
-            poss_default = self.defaults
+            poss_default = self._defaults
             for ident in path:
                 try:
                     poss_default = poss_default[ident]
                 except KeyError:
                     break
             else:
-                default = poss_default
+                # only the part of the defaults that's returned needs to be copied
+                default = _clone_defaults(poss_default)
 
         identifier_data = self.identifier_data.get_child(*path)
         try:
@@ -652,10 +691,12 @@ class Config(metaclass=ConfigMeta):
         self._lock_cache: MutableMapping[
             IdentifierData, asyncio.Lock
         ] = weakref.WeakValueDictionary()
+        # reset whenever defaults are registered
+        self._global_group: Optional[Group] = None
 
     @property
     def defaults(self):
-        return pickle.loads(pickle.dumps(self._defaults, -1))
+        return _clone_defaults(self._defaults)
 
     @classmethod
     def get_conf(
@@ -759,7 +800,10 @@ class Config(metaclass=ConfigMeta):
             If there is no global attribute by the given name and
             `force_registration` is set to :code:`True`.
         """
-        global_group = self._get_base_group(self.GLOBAL)
+        # looked up through `__dict__` as this is also called for missing attributes
+        global_group = self.__dict__.get("_global_group")
+        if global_group is None:
+            global_group = self._global_group = self._get_base_group(self.GLOBAL)
         return getattr(global_group, item)
 
     @staticmethod
@@ -805,6 +849,7 @@ class Config(metaclass=ConfigMeta):
                 _partial[k] = v
 
     def _register_default(self, key: str, **kwargs: Any):
+        self._global_group = None
         if key not in self._defaults:
             self._defaults[key] = {}
 
@@ -936,7 +981,9 @@ class Config(metaclass=ConfigMeta):
             # Don't mix in defaults with groups higher than the document level
             defaults = {}
         else:
-            defaults = self.defaults.get(category, {})
+            # Groups only read their defaults (`Group.defaults` hands out copies),
+            # so the registered defaults can be shared instead of copied.
+            defaults = self._defaults.get(category, {})
         return Group(
             identifier_data=identifier_data,
             defaults=defaults,
@@ -1181,7 +1228,7 @@ class Config(metaclass=ConfigMeta):
         """
         group = self._get_base_group(scope)
         ret = {}
-        defaults = self.defaults.get(scope, {})
+        defaults = self._defaults.get(scope, {})
 
         try:
             dict_ = await self.driver.get(group.identifier_data)
@@ -1189,7 +1236,7 @@ class Config(metaclass=ConfigMeta):
             pass
         else:
             for k, v in dict_.items():
-                data = pickle.loads(pickle.dumps(defaults, -1))
+                data = _clone_defaults(defaults)
                 data.update(v)
                 ret[int(k)] = data
 
@@ -1265,9 +1312,9 @@ class Config(metaclass=ConfigMeta):
 
     def _all_members_from_guild(self, guild_data: dict) -> dict:
         ret = {}
-        defaults = self.defaults.get(self.MEMBER, {})
+        defaults = self._defaults.get(self.MEMBER, {})
         for member_id, member_data in guild_data.items():
-            new_member_data = pickle.loads(pickle.dumps(defaults, -1))
+            new_member_data = _clone_defaults(defaults)
             new_member_data.update(member_data)
             ret[int(member_id)] = new_member_data
         return ret
@@ -1421,6 +1468,14 @@ class Config(metaclass=ConfigMeta):
         """
         await self._clear_scope(str(group_identifier))
 
+    def _get_lock(self, identifier_data: IdentifierData) -> asyncio.Lock:
+        # `setdefault()` would create a new lock even when one is already cached
+        lock = self._lock_cache.get(identifier_data)
+        if lock is None:
+            # the local reference keeps the lock alive until it's returned
+            lock = self._lock_cache[identifier_data] = asyncio.Lock()
+        return lock
+
     def get_guilds_lock(self) -> asyncio.Lock:
         """Get a lock for all guild data.
 
@@ -1488,7 +1543,7 @@ class Config(metaclass=ConfigMeta):
                 identifiers=(),
                 primary_key_len=2,
             )
-            return self._lock_cache.setdefault(id_data, asyncio.Lock())
+            return self._get_lock(id_data)
 
     def get_custom_lock(self, group_identifier: str) -> asyncio.Lock:
         """Get a lock for all data in a custom scope.
@@ -1519,7 +1574,7 @@ class Config(metaclass=ConfigMeta):
                 primary_key_len=pkey_len,
                 is_custom=is_custom,
             )
-            return self._lock_cache.setdefault(id_data, asyncio.Lock())
+            return self._get_lock(id_data)
 
 
 async def migrate(cur_driver_cls: Type[BaseDriver], new_driver_cls: Type[BaseDriver]) -> None:
@@ -1536,6 +1591,9 @@ def _str_key_dict(value: Dict[Any, _T]) -> Dict[str, _T]:
     """
     Recursively casts all keys in the given `dict` to `str`.
 
+    Dicts which already only have `str` keys are returned as-is,
+    without being copied.
+
     Parameters
     ----------
     value : Dict[Any, Any]
@@ -1547,9 +1605,38 @@ def _str_key_dict(value: Dict[Any, _T]) -> Dict[str, _T]:
         The `dict` with keys (and nested keys) casted to `str`.
 
     """
-    ret = {}
-    for k, v in value.items():
-        if isinstance(v, dict):
-            v = _str_key_dict(v)
-        ret[str(k)] = v
-    return ret
+    ret = None
+    for idx, (k, v) in enumerate(value.items()):
+        new_v = _str_key_dict(v) if isinstance(v, dict) else v
+        if ret is None:
+            if type(k) is str and new_v is v:
+                continue
+            # first item that needs casting, copy over the items before it as they are
+            ret = dict(itertools.islice(value.items(), idx))
+        ret[str(k)] = new_v
+    return value if ret is None else ret
+
+
+def _clone_defaults(value: _T) -> _T:
+    """
+    Recursively copies the given defaults.
+
+    Registered defaults only consist of JSON types so, unlike `copy.deepcopy()`
+    or a pickle round-trip, only `dict`s and `list`s need to be copied.
+
+    Parameters
+    ----------
+    value : Any
+        The defaults to copy.
+
+    Returns
+    -------
+    Any
+        A copy of the defaults which shares no mutable objects with ``value``.
+
+    """
+    if isinstance(value, dict):
+        return {k: _clone_defaults(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_clone_defaults(v) for v in value]
+    return value
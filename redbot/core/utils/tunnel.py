@@ -1,13 +1,28 @@
 import asyncio
 import discord
-from datetime import datetime
-from redbot.core.utils.chat_formatting import pagify
+import time
+from datetime import datetime, timedelta
+from redbot.core.utils.chat_formatting import escape, pagify
 import io
 import weakref
 from typing import List, Optional
 from .common_filters import filter_mass_mentions
 
-_instances = weakref.WeakValueDictionary({})
+# open tunnels indexed by both of their ends
+_instances_by_origin = weakref.WeakValueDictionary({})
+_instances_by_recipient = weakref.WeakValueDictionary({})
+
+# how many attachments of a single message are downloaded at once
+_MAX_CONCURRENT_DOWNLOADS = 4
+# longest content `pagify()` (with its default arguments) returns as a single page
+_MAX_SINGLE_PAGE_LENGTH = 2000 - 8
+
+
+async def _safe_send(destination: discord.abc.Messageable, content: str) -> None:
+    try:
+        await destination.send(content)
+    except discord.HTTPException:
+        pass
 
 
 class TunnelMeta(type):
@@ -17,31 +32,24 @@ class TunnelMeta(type):
     """
 
     def __call__(cls, *args, **kwargs):
-        lockout_tuple = ((kwargs.get("sender"), kwargs.get("origin")), kwargs.get("recipient"))
-
-        if lockout_tuple in _instances:
-            return _instances[lockout_tuple]
-
-        # this is needed because weakvalue dicts can
-        # change size without warning if an object is discarded
-        # it can raise a runtime error, so ..
-        while True:
-            try:
-                if not (
-                    any(lockout_tuple[0] == x[0] for x in _instances.keys())
-                    or any(lockout_tuple[1] == x[1] for x in _instances.keys())
-                ):
-                    # if this isn't temporarily stored, the weakref dict
-                    # will discard this before the return statement,
-                    # causing a key error
-                    temp = super(TunnelMeta, cls).__call__(*args, **kwargs)
-                    _instances[lockout_tuple] = temp
-                    return temp
-            except:  # NOQA: E722
-                # Am I really supposed to except a runtime error flake >.>
-                continue
-            else:
-                return None
+        sender_origin = (kwargs.get("sender"), kwargs.get("origin"))
+        recipient = kwargs.get("recipient")
+
+        # keep strong references to the looked up tunnels,
+        # the weakref dicts could discard them otherwise
+        by_origin = _instances_by_origin.get(sender_origin)
+        by_recipient = _instances_by_recipient.get(recipient)
+        if by_origin is not None and by_origin is by_recipient:
+            return by_origin
+        if by_origin is not None or by_recipient is not None:
+            return None
+
+        # if this isn't temporarily stored, the weakref dicts
+        # will discard this before the return statement
+        temp = super(TunnelMeta, cls).__call__(*args, **kwargs)
+        _instances_by_origin[sender_origin] = temp
+        _instances_by_recipient[recipient] = temp
+        return temp
 
 
 class Tunnel(metaclass=TunnelMeta):
@@ -69,7 +77,8 @@ class Tunnel(metaclass=TunnelMeta):
         self.sender = sender
         self.origin = origin
         self.recipient = recipient
-        self.last_interaction = datetime.utcnow()
+        # monotonic clock time, see `last_interaction`
+        self._last_interaction = time.monotonic()
 
     async def react_close(self, *, uid: int, message: str = ""):
         send_to = self.recipient if uid == self.sender.id else self.origin
@@ -80,9 +89,18 @@ class Tunnel(metaclass=TunnelMeta):
     def members(self):
         return self.sender, self.recipient
 
+    @property
+    def last_interaction(self) -> datetime:
+        """The (naive, UTC) time of the last interaction through this tunnel."""
+        return datetime.utcnow() - timedelta(seconds=time.monotonic() - self._last_interaction)
+
+    @last_interaction.setter
+    def last_interaction(self, value: datetime) -> None:
+        self._last_interaction = time.monotonic() - (datetime.utcnow() - value).total_seconds()
+
     @property
     def minutes_since(self):
-        return int((self.last_interaction - datetime.utcnow()).seconds / 60)
+        return int((time.monotonic() - self._last_interaction) / 60)
 
     @staticmethod
     async def message_forwarder(
@@ -121,7 +139,11 @@ class Tunnel(metaclass=TunnelMeta):
             see `discord.abc.Messageable.send`
         """
         rets = []
-        if content:
+        if content and len(content) <= _MAX_SINGLE_PAGE_LENGTH and content.strip():
+            # fast path for the common case of content fitting in a single message
+            page = escape(content, mass_mentions=True)
+            rets.append(await destination.send(page, files=files, embed=embed))
+        elif content:
             for page in pagify(content):
                 rets.append(await destination.send(page, files=files, embed=embed))
                 if files:
@@ -159,18 +181,23 @@ class Tunnel(metaclass=TunnelMeta):
         files = []
         max_size = 8 * 1000 * 1000
         if m.attachments and sum(a.size for a in m.attachments) <= max_size:
-            for a in m.attachments:
-                if images_only and a.height is None:
-                    # if this is None, it's not an image
-                    continue
+            semaphore = asyncio.Semaphore(_MAX_CONCURRENT_DOWNLOADS)
+
+            async def download(a: discord.Attachment) -> discord.File:
                 _fp = io.BytesIO()
-                try:
-                    await a.save(_fp, use_cached=use_cached)
-                except discord.HTTPException as e:
-                    # this is required, because animated webp files aren't cached
-                    if not (e.status == 415 and images_only and use_cached):
-                        raise
-                files.append(discord.File(_fp, filename=a.filename))
+                async with semaphore:
+                    try:
+                        await a.save(_fp, use_cached=use_cached)
+                    except discord.HTTPException as e:
+                        # this is required, because animated webp files aren't cached
+                        if not (e.status == 415 and images_only and use_cached):
+                            raise
+                return discord.File(_fp, filename=a.filename)
+
+            # if height is None, it's not an image
+            files = await asyncio.gather(
+                *(download(a) for a in m.attachments if not (images_only and a.height is None))
+            )
         return files
 
     # Backwards-compatible typo fix (GH-2496)
@@ -186,8 +213,12 @@ class Tunnel(metaclass=TunnelMeta):
             The message to send to both ends of the tunnel.
         """
 
-        tasks = [destination.send(close_message) for destination in (self.recipient, self.origin)]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        await asyncio.gather(
+            *(
+                _safe_send(destination, close_message)
+                for destination in (self.recipient, self.origin)
+            )
+        )
 
     async def communicate(
         self, *, message: discord.Message, topic: str = None, skip_message_content: bool = False
@@ -244,8 +275,13 @@ class Tunnel(metaclass=TunnelMeta):
 
         rets = await self.message_forwarder(destination=send_to, content=content, files=attach)
 
-        await message.add_reaction("\N{WHITE HEAVY CHECK MARK}")
-        await message.add_reaction("\N{NEGATIVE SQUARED CROSS MARK}")
-        self.last_interaction = datetime.utcnow()
-        await rets[-1].add_reaction("\N{NEGATIVE SQUARED CROSS MARK}")
+        async def react_to_forwarded():
+            # one after the other to keep the order of the reactions
+            await message.add_reaction("\N{WHITE HEAVY CHECK MARK}")
+            await message.add_reaction("\N{NEGATIVE SQUARED CROSS MARK}")
+
+        self._last_interaction = time.monotonic()
+        await asyncio.gather(
+            react_to_forwarded(), rets[-1].add_reaction("\N{NEGATIVE SQUARED CROSS MARK}")
+        )
         return [rets[-1].id, message.id]
@@ -1,7 +1,7 @@
 import pytest
 from redbot.core import modlog
 
-__all__ = ["mod"]
+__all__ = ["mod", "mod_cog"]
 
 
 @pytest.fixture
@@ -13,3 +13,16 @@ async def mod(config, monkeypatch, red):
 
         await modlog._init(red)
         return modlog
+
+
+@pytest.fixture
+async def mod_cog(config_fr, monkeypatch, red):
+    from redbot.core import Config
+    from redbot.cogs.mod import Mod
+
+    with monkeypatch.context() as m:
+        m.setattr(Config, "get_conf", lambda *args, **kwargs: config_fr)
+
+        cog = Mod(red)
+    yield cog
+    cog.cog_unload()
@@ -6,8 +6,10 @@ _early_init()
 import asyncio
 import json
 import logging
+import os
 import sys
 import re
+import shutil
 from copy import deepcopy
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
@@ -39,15 +41,32 @@ else:
     instance_list = list(instance_data.keys())
 
 
-def save_config(name, data, remove=False):
+def save_config(name, data, remove=False, *, old_name=None):
     _config = data_manager.load_existing_config()
     if remove and name in _config:
         _config.pop(name)
     else:
         _config[name] = data
-
-    with config_file.open("w", encoding="utf-8") as fs:
-        json.dump(_config, fs, indent=4)
+    if old_name is not None and old_name != name:
+        # instance got renamed, remove the old entry in the same write
+        _config.pop(old_name, None)
+
+    # The whole file is encoded upfront and written to a temporary file in one go
+    # which then replaces the config file so that it never ends up partially written.
+    encoded = json.dumps(_config, indent=4).encode("utf-8")
+    tmp_path = config_file.with_name(f"{config_file.stem}-{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("wb") as fs:
+            fs.write(encoded)
+            fs.flush()
+            os.fsync(fs.fileno())
+        if config_file.exists():
+            # the config contains storage credentials, keep the permissions the user set
+            shutil.copymode(config_file, tmp_path)
+        os.replace(tmp_path, config_file)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def get_data_dir(*, instance_name: str, data_path: Optional[Path], interactive: bool) -> str:
@@ -1,3 +1,6 @@
+import asyncio
+import time
+
 import pytest
 
 from redbot.pytest.mod import *
@@ -37,3 +40,82 @@ async def test_modlog_case_create(mod, ctx, member_factory):
 async def test_modlog_set_modlog_channel(mod, ctx):
     await mod.set_modlog_channel(ctx.guild, ctx.channel)
     assert await mod.get_modlog_channel(ctx.guild) == ctx.channel.id
+
+
+@pytest.mark.asyncio
+async def test_tempban_expirations_loaded(mod_cog):
+    config = mod_cog.config
+    unban_timestamp = time.time() + 3600
+    await config.guild_from_id(1).current_tempbans.set([10, 11])
+    await config.member_from_ids(1, 10).banned_until.set(unban_timestamp)
+    await config.member_from_ids(2, 20).banned_until.set(unban_timestamp)
+
+    await mod_cog._load_tempban_expirations()
+
+    # a tempban without `banned_until` is due right away
+    assert sorted(mod_cog._tempban_heap) == [(0, 1, 11), (unban_timestamp, 1, 10)]
+
+
+@pytest.mark.asyncio
+async def test_tempban_expirations_retried_in_uncached_guild(mod_cog):
+    from redbot.cogs.mod.kickban import TEMPBAN_RETRY_INTERVAL
+
+    await mod_cog.config.guild_from_id(1).current_tempbans.set([10])
+    assert mod_cog.bot.get_guild(1) is None
+
+    before = time.time()
+    await mod_cog._check_tempban_expirations({1: [10]})
+
+    assert len(mod_cog._tempban_heap) == 1
+    retry_at, guild_id, uid = mod_cog._tempban_heap[0]
+    assert (guild_id, uid) == (1, 10)
+    assert retry_at >= before + TEMPBAN_RETRY_INTERVAL
+    assert await mod_cog.config.guild_from_id(1).current_tempbans() == [10]
+
+
+@pytest.mark.asyncio
+async def test_tempban_expirations_retried_after_cancelled_check(mod_cog, monkeypatch):
+    def cancelled_get_guild(guild_id):
+        raise asyncio.CancelledError()
+
+    monkeypatch.setattr(mod_cog.bot, "get_guild", cancelled_get_guild)
+
+    await mod_cog._check_tempban_expirations({1: [10]})
+
+    assert [entry[1:] for entry in mod_cog._tempban_heap] == [(1, 10)]
+
+
+@pytest.mark.asyncio
+async def test_guild_settings_not_cached_if_changed_while_reading(
+    mod_cog, empty_guild, monkeypatch
+):
+    from redbot.core.config import Group
+
+    original_all = Group.all
+
+    async def all_and_change_settings(self, **kwargs):
+        data = await original_all(self, **kwargs)
+        # a setter finishes while the listener is still reading the settings
+        mod_cog._invalidate_guild_settings(empty_guild)
+        return data
+
+    with monkeypatch.context() as m:
+        m.setattr(Group, "all", all_and_change_settings)
+        await mod_cog._get_guild_settings(empty_guild)
+    assert empty_guild.id not in mod_cog._guild_cache
+
+    await mod_cog._get_guild_settings(empty_guild)
+    assert empty_guild.id in mod_cog._guild_cache
+
+
+@pytest.mark.asyncio
+async def test_guild_settings_invalidated_by_config_update(mod_cog, empty_guild):
+    config = mod_cog.config
+    await config.version.set("1.2.0")
+    await config.guild(empty_guild).set({"ban_mention_spam": 5})
+    # a listener read the settings before they were updated
+    assert (await mod_cog._get_guild_settings(empty_guild)).mention_spam["ban"] is None
+
+    await mod_cog._maybe_update_config()
+
+    assert (await mod_cog._get_guild_settings(empty_guild)).mention_spam["ban"] == 5
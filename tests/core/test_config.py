@@ -1,7 +1,11 @@
 import asyncio
+import gc
 from unittest.mock import patch
 import pytest
 
+from redbot.core import config as config_module
+from redbot.core.config import Config, _str_key_dict
+
 
 # region Register Tests
 @pytest.mark.asyncio
@@ -142,6 +146,15 @@ async def test_nesting_nofr(config):
     assert await config.foo() == {}
 
 
+@pytest.mark.asyncio
+async def test_registration_after_access(config):
+    config.register_global(foo=True)
+    assert await config.foo() is True
+    config.register_global(foo=False, bar={"baz": 1})
+    assert await config.foo() is False
+    assert await config.bar.baz() == 1
+
+
 # region Default Value Overrides
 @pytest.mark.asyncio
 async def test_global_default_override(config):
@@ -410,6 +423,26 @@ async def test_ctxmgr_no_shared_default(config, member_factory):
     assert 1 not in await config.member(m2).foo()
 
 
+def test_defaults_not_shared(config):
+    config.register_guild(foo={"bar": []})
+    defaults = config.defaults
+    defaults[config.GUILD]["foo"]["bar"].append(1)
+
+    assert config.defaults[config.GUILD]["foo"]["bar"] == []
+    assert config.guild_from_id(1).defaults["foo"]["bar"] == []
+
+
+@pytest.mark.asyncio
+async def test_group_all_unset_not_shared(config):
+    config.register_guild(foo={"bar": []})
+    data = await config.guild_from_id(1).all()
+    data["foo"]["bar"].append(1)
+
+    assert data == {"foo": {"bar": [1]}}
+    assert await config.guild_from_id(1).all() == {"foo": {"bar": []}}
+    assert config.defaults[config.GUILD]["foo"]["bar"] == []
+
+
 @pytest.mark.asyncio
 async def test_ctxmgr_no_unnecessary_write(config):
     config.register_global(foo=[])
@@ -493,6 +526,25 @@ async def test_cast_str_nested(config):
     assert await config.foo() == {"123": True, "456": {"789": False}}
 
 
+def test_config_instance_cache(driver):
+    conf = Config(cog_name="PyTest", unique_identifier="cache", driver=driver)
+    assert Config(cog_name="PyTest", unique_identifier="cache", driver=driver) is conf
+
+    del conf
+    gc.collect()
+    assert ("PyTest", "cache") not in config_module._config_cache
+
+
+def test_str_key_dict():
+    str_keys = {"1": {"2": []}, "3": True}
+    assert _str_key_dict(str_keys) is str_keys
+
+    mixed_keys = {"1": {"2": []}, "3": {4: {"5": None}}}
+    assert _str_key_dict(mixed_keys) == {"1": {"2": []}, "3": {"4": {"5": None}}}
+    assert _str_key_dict(mixed_keys)["1"] is mixed_keys["1"]
+    assert mixed_keys["3"] == {4: {"5": None}}
+
+
 def test_config_custom_noinit(config):
     with pytest.raises(ValueError):
         config.custom("TEST", 1, 2, 3)